@@ -35,6 +35,18 @@ class PropertyGroup(ABC):
     This group is not registered to the workspace and only visible to the parent object.
     """
 
+    __slots__ = (
+        "_allow_delete",
+        "_association",
+        "_name",
+        "_on_file",
+        "_parent",
+        "_properties",
+        "_uid",
+        "property_group_type",
+        "__weakref__",
+    )
+
     _attribute_map = {
         "Association": "association",
         "Group Name": "name",
@@ -67,7 +79,7 @@ class PropertyGroup(ABC):
 
         self._parent: ObjectBase = parent
         self._properties: list[uuid.UUID] | None = None
-        self._property_group_type = property_group_type
+        self.property_group_type: str = property_group_type
 
         parent.add_children([self])
 
@@ -202,25 +214,13 @@ class PropertyGroup(ABC):
         if not isinstance(uids, Iterable):
             return
 
-        properties = []
-        for uid in uids:
-            if isinstance(uid, str):
-                uid = uuid.UUID(uid)
-            properties.append(uid)
+        properties = [uuid.UUID(uid) if isinstance(uid, str) else uid for uid in uids]
 
         if not all(isinstance(uid, uuid.UUID) for uid in properties):
             raise TypeError("All uids must be of type uuid.UUID")
 
         self._properties = properties
 
-    @property
-    def property_group_type(self) -> str:
-        return self._property_group_type
-
-    @property_group_type.setter
-    def property_group_type(self, group_type: str):
-        self._property_group_type = group_type
-
     def remove_properties(self, data: Data | list[Data | uuid.UUID] | uuid.UUID):
         """
         Remove data from the properties.
@@ -93,13 +93,17 @@ class CellObject(Points, ABC):
         if not isinstance(indices, np.ndarray):
             raise TypeError("Indices must be a list or numpy array.")
 
-        if (
-            isinstance(self.cells, np.ndarray)
-            and np.max(indices) > self.cells.shape[0] - 1
-        ):
+        if indices.size == 0:
+            return
+
+        cells = self.cells
+        if indices.max() > cells.shape[0] - 1:
             raise ValueError("Found indices larger than the number of cells.")
 
-        cells = np.delete(self.cells, indices, axis=0)
+        cell_index = np.ones(cells.shape[0], dtype=bool)
+        cell_index[indices] = False
+        cells = cells[cell_index, :]
+
         self._cells = None
         setattr(self, "cells", cells)
 
@@ -125,15 +129,16 @@ class CellObject(Points, ABC):
         if not isinstance(indices, np.ndarray):
             raise TypeError("Indices must be a list or numpy array.")
 
-        if (
-            isinstance(self.vertices, np.ndarray)
-            and np.max(indices) > self.vertices.shape[0] - 1
-        ):
+        if indices.size == 0:
+            return
+
+        vertices = self.vertices
+        if indices.max() > vertices.shape[0] - 1:
             raise ValueError("Found indices larger than the number of vertices.")
 
-        vert_index = np.ones(self.vertices.shape[0], dtype=bool)
+        vert_index = np.ones(vertices.shape[0], dtype=bool)
         vert_index[indices] = False
-        vertices = self.vertices[vert_index, :]
+        vertices = vertices[vert_index, :]
 
         self._vertices = None
         setattr(self, "vertices", vertices)
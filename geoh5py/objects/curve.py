@@ -44,8 +44,9 @@ class Curve(CellObject):
     )
 
     def __init__(self, object_type: ObjectType, name="Curve", **kwargs):
-        self._current_line_id: uuid.UUID | None = None
+        self._current_line_id: uuid.UUID | None = uuid.uuid4()
         self._parts: np.ndarray | None = None
+        self._unique_parts: list[int] | None = None
         super().__init__(object_type, name=name, **kwargs)
 
     @property
@@ -57,27 +58,39 @@ class Curve(CellObject):
         """
         if getattr(self, "_cells", None) is None:
             if self._parts is not None:
-                cells = []
-                for part_id in self.unique_parts:
-                    ind = np.where(self.parts == part_id)[0]
-                    cells.append(np.c_[ind[:-1], ind[1:]])
-                self.cells = np.vstack(cells)
+                # Connect consecutive vertices within each part in a single pass
+                order = np.argsort(self._parts, kind="stable")
+                sorted_parts = self._parts[order]
+                same_part = sorted_parts[1:] == sorted_parts[:-1]
+                cells = np.empty((int(same_part.sum()), 2), dtype=np.int32)
+                cells[:, 0] = order[:-1][same_part]
+                cells[:, 1] = order[1:][same_part]
+                self._cells = cells
+                self._parts = None
+                self._unique_parts = None
 
             elif self.on_file:
                 self._cells = self.workspace.fetch_array_attribute(self)
 
             if self._cells is None and self.vertices is not None:
-                n_segments = self.vertices.shape[0]
-                self.cells = np.c_[
-                    np.arange(0, n_segments - 1), np.arange(1, n_segments)
-                ].astype("uint32")
+                n_segments = self.vertices.shape[0] - 1
+                cells = np.empty((max(n_segments, 0), 2), dtype=np.int32)
+                cells[:, 0] = np.arange(cells.shape[0])
+                cells[:, 1] = cells[:, 0] + 1
+                self._cells = cells
 
         return self._cells
 
     @cells.setter
     def cells(self, indices: list | np.ndarray | None):
-        if isinstance(indices, list):
-            indices = np.vstack(indices)
+        # Arrays belong to the caller, lists get converted into a new one
+        from_list = isinstance(indices, list)
+        if from_list:
+            # Blocks of cells are stacked, rows of indices converted directly
+            if indices and np.ndim(indices[0]) == 2:
+                indices = np.vstack(indices)
+            else:
+                indices = np.asarray(indices)
 
         if self._cells is not None and (
             indices is None or indices.shape[0] < self._cells.shape[0]
@@ -93,15 +106,13 @@ class Curve(CellObject):
         if not np.issubdtype(indices.dtype, np.integer):
             raise TypeError("Indices array must be of integer type")
 
-        self._cells = indices.astype(np.int32)
+        self._cells = indices.astype(np.int32, copy=not from_list)
         self._parts = None
+        self._unique_parts = None
         self.workspace.update_attribute(self, "cells")
 
     @property
     def current_line_id(self) -> uuid.UUID | None:
-        if getattr(self, "_current_line_id", None) is None:
-            self._current_line_id = uuid.uuid4()
-
         return self._current_line_id
 
     @current_line_id.setter
@@ -140,13 +151,14 @@ class Curve(CellObject):
             and self.vertices is not None
         ):
             cells = self.cells
-            parts = np.zeros(self.vertices.shape[0], dtype="int")
-            count = 0
-            for ind in range(1, cells.shape[0]):
-                if cells[ind, 0] != cells[ind - 1, 1]:
-                    count += 1
+            parts = np.zeros(self.vertices.shape[0], dtype=np.int32)
+
+            # New part wherever a segment does not start on the previous end
+            segments = np.zeros(cells.shape[0], dtype=np.int32)
+            np.cumsum(cells[1:, 0] != cells[:-1, 1], out=segments[1:])
 
-                parts[cells[ind, :]] = count
+            # Broadcast over both ends so the last cell referencing a vertex wins
+            parts[cells] = segments[:, None]
 
             self._parts = parts
 
@@ -155,15 +167,15 @@ class Curve(CellObject):
     @parts.setter
     def parts(self, indices: list | np.ndarray):
         if self.vertices is not None:
-            if isinstance(indices, list):
-                indices = np.asarray(indices, dtype="int32")
-            else:
-                indices = indices.astype("int32")
+            indices = np.asarray(indices, dtype=np.int32)
+
+            if indices.shape != (self.vertices.shape[0],):
+                raise ValueError(
+                    f"Provided parts must be of shape {self.vertices.shape[0]}"
+                )
 
-            assert indices.shape == (
-                self.vertices.shape[0],
-            ), f"Provided parts must be of shape {self.vertices.shape[0]}"
             self._parts = indices
+            self._unique_parts = None
             self._cells = None
             self.workspace.update_attribute(self, "cells")
 
@@ -173,7 +185,7 @@ class Curve(CellObject):
         :obj:`list` of :obj:`int`: Unique :obj:`~geoh5py.objects.curve.Curve.parts`
         identifiers.
         """
-        if self.parts is not None:
-            return np.unique(self.parts).tolist()
+        if self._unique_parts is None and self.parts is not None:
+            self._unique_parts = np.unique(self.parts).tolist()
 
-        return None
+        return self._unique_parts
@@ -112,7 +112,6 @@ class GridObject(ObjectBase, ABC):
                 self.workspace.copy_property_groups(
                     new_entity, self.property_groups, children_map
                 )
-                new_entity.workspace.update_attribute(new_entity, "property_groups")
 
         return new_entity
 
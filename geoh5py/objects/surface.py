@@ -53,8 +53,14 @@ class Surface(CellObject):
 
     @cells.setter
     def cells(self, indices: list | np.ndarray | None):
-        if isinstance(indices, list):
-            indices = np.vstack(indices)
+        # Arrays belong to the caller, lists get converted into a new one
+        from_list = isinstance(indices, list)
+        if from_list:
+            # Blocks of cells are stacked, rows of indices converted directly
+            if indices and np.ndim(indices[0]) == 2:
+                indices = np.vstack(indices)
+            else:
+                indices = np.asarray(indices)
 
         if self._cells is not None and (
             indices is None or indices.shape[0] < self._cells.shape[0]
@@ -70,7 +76,7 @@ class Surface(CellObject):
         if not np.issubdtype(indices.dtype, np.integer):
             raise TypeError("Indices array must be of integer type")
 
-        self._cells = indices.astype(np.int32)
+        self._cells = indices.astype(np.int32, copy=not from_list)
         self.workspace.update_attribute(self, "cells")
 
     @classmethod
@@ -173,9 +173,7 @@ class BaseElectrode(Curve, ABC):
                 new_entity.ab_cell_id.values,
                 complement.ab_cell_id.values,
             )
-            cell_mask = np.r_[
-                [(val in intersect) for val in complement.ab_cell_id.values]
-            ]
+            cell_mask = np.isin(complement.ab_cell_id.values, intersect)
 
             # Convert cell indices to vertex indices
             mask = np.zeros(complement.vertices.shape[0], dtype=bool)
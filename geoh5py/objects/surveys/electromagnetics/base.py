@@ -20,9 +20,11 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import uuid
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 from warnings import warn
 
@@ -32,7 +34,7 @@ from geoh5py.data import ReferencedData
 from geoh5py.data.float_data import FloatData
 from geoh5py.groups.property_group import PropertyGroup
 from geoh5py.objects import Curve
-from geoh5py.objects.object_base import ObjectBase
+from geoh5py.objects.object_base import ObjectBase, ObjectType
 from geoh5py.shared.utils import is_uuid
 
 if TYPE_CHECKING:
@@ -44,15 +46,49 @@ TYPE_MAP = {
     "Receivers": "receivers",
     "Base stations": "base_stations",
 }
+UUID_KEYS = (
+    "Base stations",
+    "Receivers",
+    "Transmitters",
+    "Tx ID property",
+)
+FEM_UNITS = (
+    "Hertz (Hz)",
+    "KiloHertz (kHz)",
+    "MegaHertz (MHz)",
+    "Gigahertz (GHz)",
+)
+TEM_UNITS = (
+    "Seconds (s)",
+    "Milliseconds (ms)",
+    "Microseconds (us)",
+    "Nanoseconds (ns)",
+)
 OMIT_LIST = [
     "_receivers",
     "_transmitters",
     "_base_stations",
     "_tx_id_property",
     "_metadata",
+    "_metadata_batch",
+    "_waveform",
 ]
 
 
+def _looks_like_uuid(value: str) -> bool:
+    """Cheap shape check for a hyphenated, optionally braced, UUID string."""
+    if value[:1] == "{" and value[-1:] == "}":
+        value = value[1:-1]
+
+    return (
+        len(value) == 36
+        and value[8] == "-"
+        and value[13] == "-"
+        and value[18] == "-"
+        and value[23] == "-"
+    )
+
+
 class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     """
     A base electromagnetics survey object.
@@ -60,7 +96,6 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
 
     __INPUT_TYPE = None
     __TYPE = None
-    __UNITS = None
 
     _receivers: BaseEMSurvey | None = None
     _transmitters: BaseEMSurvey | None = None
@@ -130,9 +165,9 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         """
         Append a property group to the entity and its metadata after validations.
         """
-        if self.property_groups is not None and name in [
-            pg.name for pg in self.property_groups
-        ]:
+        if self.property_groups is not None and any(
+            pg.name == name for pg in self.property_groups
+        ):
             raise ValueError(
                 f"PropertyGroup named '{name}' already exists on the survey entity. "
                 f"Consider using the 'edit_em_metadata' method with "
@@ -157,7 +192,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
             )
 
         if isinstance(data_block, list):
-            assert np.all([entry.parent == self for entry in data_block]), (
+            assert all(entry.parent is self for entry in data_block), (
                 f"The list of values provided for the component '{name}' "
                 f"must contain {FloatData} belonging to the target survey."
             )
@@ -165,14 +200,16 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
             data_list = data_block
 
         else:
-            data_list = []
             for channel, attr in data_block.items():
                 if not isinstance(attr, dict):
                     raise TypeError(
                         f"Given value to data {channel} should of type {dict} or attributes. "
                         f"Type {type(attr)} given instead."
                     )
-                data_list.append(self.add_data({channel: attr}))
+
+            data_list = self.add_data(data_block)
+            if not isinstance(data_list, list):
+                data_list = [data_list]
 
         prop_group = self.add_data_to_group(data_list, name)
         self.edit_em_metadata({"Property groups": prop_group})
@@ -189,11 +226,15 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
 
     @channels.setter
     def channels(self, values: list | np.ndarray):
-        if isinstance(values, np.ndarray):
+        if (
+            isinstance(values, np.ndarray)
+            and values.ndim == 1
+            and values.dtype.kind == "f"
+        ):
             values = values.tolist()
 
-        if not isinstance(values, list) or not np.all(
-            [isinstance(x, float) for x in values]
+        elif not isinstance(values, list) or not all(
+            isinstance(x, float) for x in values
         ):
             raise TypeError(
                 f"Values provided as 'channels' must be a list of {float}. {type(values)} provided"
@@ -211,16 +252,17 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         """
         Rapid access to the list of data entities for all components.
         """
-        if "Property groups" in self.metadata["EM Dataset"]:
+        em_dataset = self.metadata["EM Dataset"]
+        if "Property groups" in em_dataset:
             components = {}
-            for name in self.metadata["EM Dataset"]["Property groups"]:
+            for name in em_dataset["Property groups"]:
                 prop_group = self.find_or_create_property_group(name=name)
 
                 if prop_group.properties is None:
                     continue
 
                 components[name] = [
-                    self.workspace.get_entity(uid)[0] for uid in prop_group.properties
+                    self.workspace.find_data(uid) for uid in prop_group.properties
                 ]
             return components
 
@@ -252,9 +294,13 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         )
 
         # Copy metadata except reference to entities UUID
-        for key, value in self.metadata["EM Dataset"].items():
-            if not isinstance(value, (uuid.UUID, type(None))):
-                new_entity.edit_em_metadata({key: value})
+        new_entity.edit_em_metadata(
+            {
+                key: value
+                for key, value in self.metadata["EM Dataset"].items()
+                if value is not None and not isinstance(value, uuid.UUID)
+            }
+        )
 
         if self.complement is not None:
             self.copy_complement(
@@ -326,7 +372,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
 
     @property
     @abstractmethod
-    def default_units(self) -> list[str]:
+    def default_units(self) -> tuple[str, ...]:
         """
         List of accepted units.
         """
@@ -339,17 +385,67 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         :param entries: Metadata key value pairs.
         """
         em_metadata = self.metadata.get("EM Dataset", {})
+        updated = False
 
         for key, value in entries.items():
             if key == "Property groups":
                 self._edit_validate_property_groups(value)
+                updated = True
             elif value is None:
                 if key in em_metadata:
                     del em_metadata[key]
-            else:
+                    updated = True
+            elif (
+                key in TYPE_MAP
+                or em_metadata.get(key) is value
+                or em_metadata.get(key) != value
+            ):
+                # Entity references always propagate to the dependents and values
+                # passed back by reference may have been modified in place
                 em_metadata[key] = value
+                updated = True
+
+        if not updated:
+            return
+
+        if getattr(self, "_metadata_batch", None) is not None:
+            self._metadata_batch = True
+        else:
+            self.metadata = {"EM Dataset": em_metadata}
 
-        self.metadata = {"EM Dataset": em_metadata}
+    @contextmanager
+    def edit_em_metadata_batch(self):
+        """
+        Context manager deferring the metadata updates triggered by
+        :func:`~geoh5py.objects.surveys.electromagnetics.base.BaseEMSurvey.edit_em_metadata`
+        until exit, so that several edits get written to file only once.
+        If the block raises, the metadata is restored and nothing is written.
+
+        .. code-block:: python
+
+            with survey.edit_em_metadata_batch():
+                survey.timing_mark = 0.0
+                survey.waveform = waveform
+        """
+        if getattr(self, "_metadata_batch", None) is not None:
+            yield self
+            return
+
+        previous = copy.deepcopy(self.metadata["EM Dataset"])
+        self._metadata_batch = False
+        try:
+            yield self
+        except BaseException:
+            # Edits are applied in place, shared with the dependents
+            em_metadata = self.metadata["EM Dataset"]
+            em_metadata.clear()
+            em_metadata.update(previous)
+            raise
+        else:
+            if self._metadata_batch:
+                self.metadata = {"EM Dataset": self.metadata["EM Dataset"]}
+        finally:
+            del self._metadata_batch
 
     def edit_metadata(self, entries: dict[str, Any]):
         """
@@ -369,10 +465,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     @property
     def input_type(self) -> str | None:
         """Data input type. Must be one of 'Rx', 'Tx' or 'Tx and Rx'"""
-        if "Input type" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"]["Input type"]
-
-        return None
+        return self.metadata["EM Dataset"].get("Input type")
 
     @input_type.setter
     def input_type(self, value: str):
@@ -389,7 +482,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     @property
     def metadata(self):
         """Metadata attached to the entity."""
-        if getattr(self, "_metadata", None) is None:
+        if self._metadata is None:
             metadata = self.workspace.fetch_metadata(self.uid)
 
             if metadata is None:
@@ -434,7 +527,11 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
             )
 
         for key, value in values["EM Dataset"].items():
-            if isinstance(value, str):
+            if (
+                isinstance(value, str)
+                and (key in UUID_KEYS or key.endswith(" property"))
+                and _looks_like_uuid(value)
+            ):
                 try:
                     values["EM Dataset"][key] = uuid.UUID(value)
                 except ValueError:
@@ -443,11 +540,15 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         self._metadata = values
         self.workspace.update_attribute(self, "metadata")
 
+        updated = {id(self)}
         for elem in ["receivers", "transmitters", "base_stations"]:
             dependent = getattr(self, elem, None)
-            if dependent is not None and dependent is not self:
-                setattr(dependent, "_metadata", values)
-                self.workspace.update_attribute(dependent, "metadata")
+            if dependent is None or id(dependent) in updated:
+                continue
+
+            updated.add(id(dependent))
+            setattr(dependent, "_metadata", values)
+            self.workspace.update_attribute(dependent, "metadata")
 
     @property
     def receivers(self) -> BaseEMSurvey | None:
@@ -455,8 +556,9 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         The associated TEM receivers.
         """
         if getattr(self, "_receivers", None) is None:
-            if self.metadata is not None and "Receivers" in self.metadata["EM Dataset"]:
-                receiver = self.metadata["EM Dataset"]["Receivers"]
+            metadata = self.metadata
+            if metadata is not None and "Receivers" in metadata["EM Dataset"]:
+                receiver = metadata["EM Dataset"]["Receivers"]
                 receiver_entity = self.workspace.get_entity(receiver)[0]
 
                 if isinstance(receiver_entity, BaseEMSurvey):
@@ -477,10 +579,7 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
     @property
     def survey_type(self) -> str | None:
         """Data input type. Must be one of 'Rx', 'Tx' or 'Tx and Rx'"""
-        if "Survey type" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"]["Survey type"]
-
-        return None
+        return self.metadata["EM Dataset"].get("Survey type")
 
     @property
     def transmitters(self):
@@ -488,11 +587,9 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
         The associated TEM transmitters (sources).
         """
         if getattr(self, "_transmitters", None) is None:
-            if (
-                self.metadata is not None
-                and "Transmitters" in self.metadata["EM Dataset"]
-            ):
-                transmitter = self.metadata["EM Dataset"]["Transmitters"]
+            metadata = self.metadata
+            if metadata is not None and "Transmitters" in metadata["EM Dataset"]:
+                transmitter = metadata["EM Dataset"]["Transmitters"]
                 transmitter_entity = self.workspace.get_entity(transmitter)[0]
 
                 if isinstance(transmitter_entity, BaseEMSurvey):
@@ -546,26 +643,25 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
             self.metadata["EM Dataset"]["Property groups"] = []
             return
 
+        if self.property_groups is None:
+            return
+
         if not isinstance(values, list):
             values = [values]
 
-        groups = (
-            {group.name: group for group in self.property_groups}
-            if self.property_groups
-            else {}
-        )
+        groups = {group.name: group for group in self.property_groups}
+        members = set(groups.values())
+        metadata_groups = self.metadata["EM Dataset"]["Property groups"]
+        metadata_names = set(metadata_groups)
 
         for value in values:
-            if self.property_groups is None:
-                continue
-
             if not isinstance(value, (PropertyGroup, str)):
                 raise TypeError(
                     "Input value for 'Property groups' must be a PropertyGroup or "
                     "name of an existing PropertyGroup."
                 )
 
-            if not (value in groups or value in groups.values()):
+            if value not in (groups if isinstance(value, str) else members):
                 raise ValueError("Property group must be an existing PropertyGroup.")
 
             if isinstance(value, str):
@@ -579,8 +675,9 @@ class BaseEMSurvey(ObjectBase, ABC):  # pylint: disable=too-many-public-methods
                     + "differ from the number of 'channels'."
                 )
 
-            if value.name not in self.metadata["EM Dataset"]["Property groups"]:
-                self.metadata["EM Dataset"]["Property groups"].append(value.name)
+            if value.name not in metadata_names:
+                metadata_groups.append(value.name)
+                metadata_names.add(value.name)
 
     def _super_copy(
         self,
@@ -627,7 +724,7 @@ class MovingLoopGroundEMSurvey(BaseEMSurvey, Curve):
 
     @loop_radius.setter
     def loop_radius(self, value: float | None):
-        if not isinstance(value, (float, type(None))):
+        if value is not None and not isinstance(value, float):
             raise TypeError("Input 'loop_radius' must be of type 'float'")
         self.edit_em_metadata({"Loop radius": value})
 
@@ -678,27 +775,30 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
         ):
             return None
 
-        intersect = np.intersect1d(
-            new_entity.tx_id_property.values,
-            self.complement.tx_id_property.values,
-        )
+        complement_ids = self.complement.tx_id_property.values
+        intersect = np.intersect1d(new_entity.tx_id_property.values, complement_ids)
+
+        # Look up the sorted intersection once for both receivers and transmitters
+        in_intersect = np.zeros(complement_ids.shape[0], dtype=bool)
+        if intersect.size > 0:
+            index = np.minimum(
+                np.searchsorted(intersect, complement_ids), intersect.size - 1
+            )
+            in_intersect = intersect[index] == complement_ids
+
+        tx_ids = complement_ids[in_intersect]
 
         # Convert cell indices to vertex indices
         if isinstance(
             self.complement,
             self.default_receiver_type,
         ):
-            mask = np.r_[
-                [(val in intersect) for val in self.complement.tx_id_property.values]
-            ]
-            tx_ids = self.complement.tx_id_property.values[mask]
+            mask = in_intersect
         else:
-            cell_mask = np.r_[
-                [(val in intersect) for val in self.complement.tx_id_property.values]
-            ]
             mask = np.zeros(self.complement.vertices.shape[0], dtype=bool)
-            mask[self.complement.cells[cell_mask, :]] = True
-            tx_ids = self.complement.tx_id_property.values[cell_mask]
+            # Scatter one column at a time to avoid a (n_selected, 2) temporary
+            for column in self.complement.cells.T:
+                mask[column[in_intersect]] = True
 
         new_complement = (
             self.complement._super_copy(  # pylint: disable=protected-access
@@ -722,22 +822,19 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
             new_complement.tx_id_property = tx_ids
 
             # Re-number the tx_id_property
-            value_map = {
-                val: ind
-                for ind, val in enumerate(
-                    np.r_[0, np.unique(new_entity.transmitters.tx_id_property.values)]
-                )
-            }
+            unique_ids = np.unique(
+                np.r_[0, new_entity.transmitters.tx_id_property.values]
+            )
             new_map = {
-                val: new_entity.transmitters.tx_id_property.value_map.map[ind]
-                for ind, val in value_map.items()
+                ind: new_entity.transmitters.tx_id_property.value_map.map[val]
+                for ind, val in enumerate(unique_ids)
             }
-            new_complement.tx_id_property.values = np.asarray(
-                [value_map[val] for val in new_complement.tx_id_property.values]
+            new_complement.tx_id_property.values = np.searchsorted(
+                unique_ids, new_complement.tx_id_property.values
             )
             new_complement.tx_id_property.entity_type.value_map = new_map
-            new_entity.tx_id_property.values = np.asarray(
-                [value_map[val] for val in new_entity.tx_id_property.values]
+            new_entity.tx_id_property.values = np.searchsorted(
+                unique_ids, new_entity.tx_id_property.values
             )
             new_entity.tx_id_property.entity_type.value_map = new_map
 
@@ -766,15 +863,15 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
             value = self.get_data(value)[0]
 
         if isinstance(value, np.ndarray):
+            value = np.asarray(value, dtype=np.int32)
+
             if (
                 self.complement is not None
                 and self.complement.tx_id_property is not None
             ):
                 entity_type = self.complement.tx_id_property.entity_type
             else:
-                value_map = {
-                    ind: f"Loop {ind}" for ind in np.unique(value.astype(np.int32))
-                }
+                value_map = {ind: f"Loop {ind}" for ind in np.unique(value)}
                 value_map[0] = "Unknown"
                 entity_type = {  # type: ignore
                     "primitive_type": "REFERENCED",
@@ -784,14 +881,14 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
             value = self.add_data(
                 {
                     "Transmitter ID": {
-                        "values": value.astype(np.int32),
+                        "values": value,
                         "entity_type": entity_type,
                         "type": "referenced",
                     }
                 }
             )
 
-        if not isinstance(value, (ReferencedData, type(None))):
+        if value is not None and not isinstance(value, ReferencedData):
             raise TypeError(
                 "Input value for 'tx_id_property' should be of type uuid.UUID, "
                 "ReferencedData, np.ndarray or None.)"
@@ -805,13 +902,13 @@ class LargeLoopGroundEMSurvey(BaseEMSurvey, Curve):
 
 class AirborneEMSurvey(BaseEMSurvey, Curve):
     __INPUT_TYPE = ["Rx", "Tx", "Tx and Rx"]
-    _PROPERTY_MAP = {
-        "crossline_offset": "Crossline offset",
-        "inline_offset": "Inline offset",
-        "pitch": "Pitch",
-        "roll": "Roll",
-        "vertical_offset": "Vertical offset",
-        "yaw": "Yaw",
+    _PROPERTY_KEYS = {
+        "crossline_offset": ("Crossline offset value", "Crossline offset property"),
+        "inline_offset": ("Inline offset value", "Inline offset property"),
+        "pitch": ("Pitch value", "Pitch property"),
+        "roll": ("Roll value", "Roll property"),
+        "vertical_offset": ("Vertical offset value", "Vertical offset property"),
+        "yaw": ("Yaw value", "Yaw property"),
     }
 
     @property
@@ -834,24 +931,28 @@ class AirborneEMSurvey(BaseEMSurvey, Curve):
         """
         Fetch entry from the metadata.
         """
-        field = self._PROPERTY_MAP.get(key, "")
-        if field + " value" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"][field + " value"]
-        if field + " property" in self.metadata["EM Dataset"]:
-            return self.metadata["EM Dataset"][field + " property"]
-        return None
+        if key not in self._PROPERTY_KEYS:
+            return None
+
+        value_key, property_key = self._PROPERTY_KEYS[key]
+        em_dataset = self.metadata["EM Dataset"]
+        value = em_dataset.get(value_key)
+        if value is None:
+            value = em_dataset.get(property_key)
+
+        return value
 
     def set_metadata(self, key: str, value: float | uuid.UUID | None):
-        if key not in self._PROPERTY_MAP:
+        if key not in self._PROPERTY_KEYS:
             raise ValueError(f"No property map found for key metadata '{key}'.")
 
-        field = self._PROPERTY_MAP[key]
+        value_key, property_key = self._PROPERTY_KEYS[key]
         if isinstance(value, float):
-            self.edit_em_metadata({field + " value": value, field + " property": None})
+            self.edit_em_metadata({value_key: value, property_key: None})
         elif isinstance(value, uuid.UUID):
-            self.edit_em_metadata({field + " value": None, field + " property": value})
+            self.edit_em_metadata({value_key: None, property_key: value})
         elif value is None:
-            self.edit_em_metadata({field + " value": None, field + " property": None})
+            self.edit_em_metadata({value_key: None, property_key: None})
         else:
             raise TypeError(
                 f"Input '{key}' must be one of type float, uuid.UUID or None"
@@ -875,7 +976,7 @@ class AirborneEMSurvey(BaseEMSurvey, Curve):
 
     @loop_radius.setter
     def loop_radius(self, value: float | None):
-        if not isinstance(value, (float, type(None))):
+        if value is not None and not isinstance(value, float):
             raise TypeError("Input 'loop_radius' must be of type 'float'")
         self.edit_em_metadata({"Loop radius": value})
 
@@ -897,7 +998,7 @@ class AirborneEMSurvey(BaseEMSurvey, Curve):
 
     @relative_to_bearing.setter
     def relative_to_bearing(self, value: bool | None):
-        if not isinstance(value, (bool, type(None))):
+        if value is not None and not isinstance(value, bool):
             raise TypeError("Input 'relative_to_bearing' must be one of type 'bool'")
         self.edit_em_metadata({"Angles relative to bearing": value})
 
@@ -936,45 +1037,46 @@ class AirborneEMSurvey(BaseEMSurvey, Curve):
 
 
 class FEMSurvey(BaseEMSurvey):
-    __UNITS = __UNITS = [
-        "Hertz (Hz)",
-        "KiloHertz (kHz)",
-        "MegaHertz (MHz)",
-        "Gigahertz (GHz)",
-    ]
-
     @property
-    def default_units(self) -> list[str]:
+    def default_units(self) -> tuple[str, ...]:
         """
         Accepted frequency units.
 
         Must be one of "Hertz (Hz)", "KiloHertz (kHz)", "MegaHertz (MHz)", or
         "Gigahertz (GHz)",
 
-        :returns: List of acceptable units for frequency domain channels.
+        :returns: Acceptable units for frequency domain channels.
         """
-        return self.__UNITS
+        return FEM_UNITS
 
 
 class TEMSurvey(BaseEMSurvey):
-    __UNITS = [
-        "Seconds (s)",
-        "Milliseconds (ms)",
-        "Microseconds (us)",
-        "Nanoseconds (ns)",
-    ]
+    def __init__(self, object_type: ObjectType, **kwargs):
+        self._waveform: tuple[list, np.ndarray] | None = None
+
+        super().__init__(object_type, **kwargs)
 
     @property
-    def default_units(self) -> list[str]:
+    def default_units(self) -> tuple[str, ...]:
         """
         Accepted time units.
 
         Must be one of "Seconds (s)", "Milliseconds (ms)", "Microseconds (us)"
         or "Nanoseconds (ns)"
 
-        :returns: List of acceptable units for time domain channels.
+        :returns: Acceptable units for time domain channels.
         """
-        return self.__UNITS
+        return TEM_UNITS
+
+    def edit_em_metadata(self, entries: dict[str, Any]):
+        if "Waveform" in entries:
+            # The discretization may have been edited in place, drop the decoded
+            # waveform of all entities sharing the metadata
+            for survey in [self, self.receivers, self.transmitters]:
+                if isinstance(survey, TEMSurvey):
+                    survey._waveform = None  # pylint: disable=protected-access
+
+        super().edit_em_metadata(entries)
 
     @property
     def timing_mark(self) -> float | None:
@@ -983,23 +1085,17 @@ class TEMSurvey(BaseEMSurvey):
         Generally used as the reference (time=0.0) for the provided
         (-) on-time an (+) off-time :attr:`channels`.
         """
-        if (
-            "Waveform" in self.metadata["EM Dataset"]
-            and "Timing mark" in self.metadata["EM Dataset"]["Waveform"]
-        ):
-            timing_mark = self.metadata["EM Dataset"]["Waveform"]["Timing mark"]
-            return timing_mark
+        waveform = self.metadata["EM Dataset"].get("Waveform")
 
-        return None
+        return None if waveform is None else waveform.get("Timing mark")
 
     @timing_mark.setter
     def timing_mark(self, timing_mark: float | None):
-        if not isinstance(timing_mark, (float, type(None))):
+        if timing_mark is not None and not isinstance(timing_mark, float):
             raise ValueError("Input timing_mark must be a float or None.")
 
-        if self.waveform is not None:
-            value = self.metadata["EM Dataset"]["Waveform"]
-        else:
+        value = self.metadata["EM Dataset"].get("Waveform")
+        if value is None or "Discretization" not in value:
             value = {}
 
         if timing_mark is None and "Timing mark" in value:
@@ -1024,27 +1120,28 @@ class TEMSurvey(BaseEMSurvey):
             ]
 
         """
-        if (
-            "Waveform" in self.metadata["EM Dataset"]
-            and "Discretization" in self.metadata["EM Dataset"]["Waveform"]
-        ):
-            waveform = np.vstack(
-                [
-                    [row["time"], row["current"]]
-                    for row in self.metadata["EM Dataset"]["Waveform"]["Discretization"]
-                ]
-            )
-            return waveform
-        return None
+        waveform = self.metadata["EM Dataset"].get("Waveform")
+        discretization = None if waveform is None else waveform.get("Discretization")
+        if discretization is None:
+            return None
+
+        # Decode once per discretization list, edits made through
+        # edit_em_metadata reset the cache
+        if self._waveform is None or self._waveform[0] is not discretization:
+            values = np.empty((len(discretization), 2), dtype=np.float64)
+            values[:, 0] = [row["time"] for row in discretization]
+            values[:, 1] = [row["current"] for row in discretization]
+            self._waveform = (discretization, values)
+
+        return self._waveform[1].copy()
 
     @waveform.setter
     def waveform(self, waveform: np.ndarray | None):
-        if not isinstance(waveform, (np.ndarray, type(None))):
+        if waveform is not None and not isinstance(waveform, np.ndarray):
             raise TypeError("Input waveform must be a numpy.ndarray or None.")
 
-        if self.timing_mark is not None:
-            value = self.metadata["EM Dataset"]["Waveform"]
-        else:
+        value = self.metadata["EM Dataset"].get("Waveform")
+        if value is None or value.get("Timing mark") is None:
             value = {"Timing mark": 0.0}
 
         if isinstance(waveform, np.ndarray):
@@ -1053,18 +1150,22 @@ class TEMSurvey(BaseEMSurvey):
                     "Input waveform must be a numpy.ndarray of shape (*, 2)."
                 )
 
+            values = np.array(waveform, dtype=np.float64)
             value["Discretization"] = [
-                {"current": row[1], "time": row[0]} for row in waveform
+                {"current": current, "time": time} for time, current in values.tolist()
             ]
 
         self.edit_em_metadata({"Waveform": value})
 
+        if isinstance(waveform, np.ndarray):
+            self._waveform = (value["Discretization"], values)
+
     @property
     def waveform_parameters(self) -> dict | None:
         """Access the waveform parameters stored as a dictionary."""
-        waveform = self.get_data("_waveform_parameters")[0]
+        data = self.get_data("_waveform_parameters")
 
-        if waveform is not None:
-            return json.loads(waveform.values)
+        if not data:
+            return None
 
-        return None
+        return json.loads(data[0].values)
@@ -60,11 +60,9 @@ class TipperSurvey(FEMSurvey, AirborneEMSurvey):
             return self
 
         if getattr(self, "_base_stations", None) is None:
-            if (
-                self.metadata is not None
-                and "Base stations" in self.metadata["EM Dataset"]
-            ):
-                base_station = self.metadata["EM Dataset"]["Base stations"]
+            metadata = self.metadata
+            if metadata is not None and "Base stations" in metadata["EM Dataset"]:
+                base_station = metadata["EM Dataset"]["Base stations"]
                 base_station_entity = self.workspace.get_entity(base_station)[0]
 
                 if isinstance(base_station_entity, TipperBaseStations):
@@ -74,7 +72,7 @@ class TipperSurvey(FEMSurvey, AirborneEMSurvey):
 
     @base_stations.setter
     def base_stations(self, base: TipperBaseStations):
-        if not isinstance(base, (TipperBaseStations, type(None))):
+        if base is not None and not isinstance(base, TipperBaseStations):
             raise TypeError(
                 f"Input `base_stations` must be of type '{TipperBaseStations}' or None"
             )
@@ -163,13 +161,6 @@ class TipperSurvey(FEMSurvey, AirborneEMSurvey):
             }
         }
 
-    @property
-    def default_units(self) -> list[str]:
-        """Accepted time units. Must be one of "Seconds (s)",
-        "Milliseconds (ms)", "Microseconds (us)" or "Nanoseconds (ns)"
-        """
-        return self.__UNITS
-
 
 class TipperReceivers(TipperSurvey, Curve):  # pylint: disable=too-many-ancestors
     """
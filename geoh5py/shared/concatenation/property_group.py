@@ -29,6 +29,8 @@ if TYPE_CHECKING:
 
 
 class ConcatenatedPropertyGroup(PropertyGroup):
+    __slots__ = ()
+
     _parent: ConcatenatedObject
 
     def __init__(self, parent: ConcatenatedObject, **kwargs):
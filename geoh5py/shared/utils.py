@@ -251,8 +251,11 @@ def are_objects_similar(obj1, obj2, ignore: list[str] | None):
     """
     assert isinstance(obj1, type(obj2)), "Objects are not the same type."
 
-    attributes1 = getattr(obj1, "__dict__", obj1)
-    attributes2 = getattr(obj2, "__dict__", obj2)
+    attributes1 = obj1
+    attributes2 = obj2
+    if hasattr(obj1, "__dict__") or hasattr(obj1, "__slots__"):
+        attributes1 = instance_attributes(obj1)
+        attributes2 = instance_attributes(obj2)
 
     # remove the ignore attributes
     if isinstance(ignore, list) and isinstance(attributes1, dict):
@@ -315,22 +318,41 @@ def compare_entities(
     base_ignore = ["_workspace", "_children", "_visual_parameters", "_entity_class"]
     ignore_list = base_ignore + ignore if ignore else base_ignore
 
-    for attr in [k for k in object_a.__dict__.keys() if k not in ignore_list]:
-        if isinstance(getattr(object_a, attr[1:]), ABC):
+    for attr in [k for k in instance_attributes(object_a) if k not in ignore_list]:
+        key = attr[1:] if attr[0] == "_" else attr
+        if isinstance(getattr(object_a, key), ABC):
             compare_entities(
-                getattr(object_a, attr[1:]), getattr(object_b, attr[1:]), ignore=ignore
+                getattr(object_a, key), getattr(object_b, key), ignore=ignore
             )
         else:
-            if isinstance(getattr(object_a, attr[1:]), np.ndarray):
-                compare_arrays(object_a, object_b, attr[1:], decimal=decimal)
-            elif isinstance(getattr(object_a, attr[1:]), float):
-                compare_floats(object_a, object_b, attr[1:], decimal=decimal)
-            elif isinstance(getattr(object_a, attr[1:]), list):
-                compare_list(object_a, object_b, attr[1:], ignore)
+            if isinstance(getattr(object_a, key), np.ndarray):
+                compare_arrays(object_a, object_b, key, decimal=decimal)
+            elif isinstance(getattr(object_a, key), float):
+                compare_floats(object_a, object_b, key, decimal=decimal)
+            elif isinstance(getattr(object_a, key), list):
+                compare_list(object_a, object_b, key, ignore)
             else:
                 assert np.all(
-                    getattr(object_a, attr[1:]) == getattr(object_b, attr[1:])
-                ), f"Output attribute '{attr[1:]}' for {object_a} do not match input {object_b}"
+                    getattr(object_a, key) == getattr(object_b, key)
+                ), f"Output attribute '{key}' for {object_a} do not match input {object_b}"
+
+
+def instance_attributes(object_) -> dict:
+    """
+    Collect the instance attributes of an object, whether stored in its
+    '__dict__' or declared as '__slots__'.
+
+    :param object_: The object to extract attributes from.
+
+    :return: Dictionary of attribute names and values.
+    """
+    attributes = dict(getattr(object_, "__dict__", {}))
+    for cls in type(object_).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if name not in ("__dict__", "__weakref__") and hasattr(object_, name):
+                attributes[name] = getattr(object_, name)
+
+    return attributes
 
 
 def iterable(value: Any, checklen: bool = False) -> bool:
@@ -368,6 +390,9 @@ def iterable_message(valid: list[Any] | None) -> str:
 
 def is_uuid(value: str) -> bool:
     """Check if a string is UUID compliant."""
+    if isinstance(value, UUID):
+        return True
+
     try:
         UUID(str(value))
         return True
@@ -634,11 +659,10 @@ def map_attributes(object_, **kwargs):
         warnings.warn(f"Object {object_} does not have an attribute map.")
         return
 
+    attribute_map = getattr(object_, "_attribute_map")
     for attr, item in kwargs.items():
         try:
-            if attr in getattr(object_, "_attribute_map"):
-                attr = getattr(object_, "_attribute_map")[attr]
-            setattr(object_, attr, item)
+            setattr(object_, attribute_map.get(attr, attr), item)
         except AttributeError:
             continue
 
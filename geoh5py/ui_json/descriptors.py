@@ -59,4 +59,6 @@ class FormValueAccess:
 
     def __set__(self, obj: FormParameter, value):
         setattr(getattr(obj, self.private), "value", value)
-        obj._active_members.append(self.private[1:])
+        member = self.private[1:]
+        if member not in obj._active_members:
+            obj._active_members.append(member)
@@ -94,7 +94,7 @@ class TypeEnforcer(Enforcer):
 
     def rule(self, value) -> bool:
         """True if value is one of the valid types."""
-        return any(isinstance(value, k) for k in self.validations.union({type(None)}))
+        return value is None or isinstance(value, tuple(self.validations))
 
 
 class ValueEnforcer(Enforcer):
@@ -333,9 +333,27 @@ class EnforcerPool:
 
         return EnforcerPool.enforcer_types[enforcer_type](validation)
 
+    def update(self, validations: SetDict):
+        """
+        Update the pool from validations, recruiting only new or changed enforcers.
+
+        :param validations: Encodes validations as enforcer type and
+            validation key value pairs.
+        """
+        current = {k.enforcer_type: k for k in self.enforcers}
+        enforcers = []
+        for enforcer_type, validation in validations.items():
+            enforcer = current.get(enforcer_type)
+            if enforcer is None or enforcer.validations != validation:
+                enforcer = self._recruit_enforcer(enforcer_type, validation)
+            enforcers.append(enforcer)
+
+        self.enforcers = enforcers
+
     def enforce(self, value: Any):
         """Enforce rules from all enforcers in the pool."""
 
+        self._errors = []
         for enforcer in self.enforcers:
             self._capture_error(enforcer, value)
 
@@ -64,10 +64,15 @@ class MemberKeys:
         "isValue": "is_value",
     }
 
+    _snake_to_camel: dict[str, str] | None = None
+
     @property
     def snake_to_camel(self) -> dict[str, str]:
         """Gives the inverse map to camel_to_snake."""
-        return {v: k for k, v in self.camel_to_snake.items()}
+        if self._snake_to_camel is None:
+            self._snake_to_camel = {v: k for k, v in self.camel_to_snake.items()}
+
+        return self._snake_to_camel
 
     def map_key(self, key: str, convention: str = "snake"):
         """Map a string from snake to camel or vice versa."""
@@ -87,6 +92,7 @@ class MemberKeys:
 
 
 MEMBER_KEYS = MemberKeys()
+DEPENDENCY_TYPES = ("enabled", "disabled")
 
 
 class FormParameter:  # pylint: disable=too-many-instance-attributes
@@ -122,6 +128,26 @@ class FormParameter:  # pylint: disable=too-many-instance-attributes
         by way of the FormValueAccess descriptor.
     """
 
+    __slots__ = (
+        "name",
+        "enforcers",
+        "_value",
+        "_label",
+        "_enabled",
+        "_optional",
+        "_group_optional",
+        "_main",
+        "_group",
+        "_dependency",
+        "_dependency_type",
+        "_group_dependency",
+        "_group_dependency_type",
+        "_tooltip",
+        "_extra_members",
+        "_active_members",
+        "_validations",
+    )
+
     static_validations = {"required_form_members": ["label", "value"]}
     identifier_members: list[str] = []
 
@@ -141,11 +167,11 @@ class FormParameter:  # pylint: disable=too-many-instance-attributes
         self._group = StringParameter("group")
         self._dependency = StringParameter("dependency")
         self._dependency_type = ValueRestrictedParameter(
-            "dependency_type", ["enabled", "disabled"], value="enabled"
+            "dependency_type", DEPENDENCY_TYPES, value="enabled"
         )
         self._group_dependency = StringParameter("group_dependency")
         self._group_dependency_type = ValueRestrictedParameter(
-            "group_dependency_type", ["enabled", "disabled"], value="enabled"
+            "group_dependency_type", DEPENDENCY_TYPES, value="enabled"
         )
         self._tooltip = StringParameter("tooltip")
         self._allow_values_access()
@@ -163,7 +189,8 @@ class FormParameter:  # pylint: disable=too-many-instance-attributes
         """Returns a dictionary of static and inferred validations."""
         if not self._validations:
             self._validations.update(self.dynamic_validations)
-            self._validations.update(self.static_validations)
+            # SetDict.update rewrites its argument, keep the class constant intact
+            self._validations.update(dict(self.static_validations))
 
         return self._validations
 
@@ -212,8 +239,9 @@ class FormParameter:  # pylint: disable=too-many-instance-attributes
 
         error_list = []
         members = MEMBER_KEYS.map(members)
+        valid_members = set(self.valid_members)
         for member in list(members):
-            if member in self.valid_members:
+            if member in valid_members:
                 try:
                     setattr(self, member, members.pop(member))
                 except BaseValidationError as err:
@@ -234,7 +262,15 @@ class FormParameter:  # pylint: disable=too-many-instance-attributes
     def valid_members(self) -> list[str]:
         """Recognized form member names."""
         exclusions = ["_extra_members", "_active_members", "_validations"]
-        private_attrs = [k for k in self.__dict__ if k.startswith("_")]
+        attributes = [
+            k for cls in type(self).__mro__ for k in getattr(cls, "__slots__", ())
+        ]
+        attributes += list(getattr(self, "__dict__", {}))
+        private_attrs = [
+            k
+            for k in dict.fromkeys(attributes)
+            if k.startswith("_") and hasattr(self, k)
+        ]
         return [k[1:] for k in private_attrs if k not in exclusions]
 
     @property
@@ -255,8 +291,7 @@ class FormParameter:  # pylint: disable=too-many-instance-attributes
     def is_form(cls, form: dict[str, Any]) -> bool:
         """Returns True if form contains any identifier members."""
         id_members = cls.identifier_members
-        form_members = MEMBER_KEYS.map(form)
-        return any(k in form_members for k in id_members)
+        return any(MEMBER_KEYS.map_key(k) in id_members for k in form)
 
     @property
     def value(self):
@@ -279,20 +314,28 @@ class FormParameter:  # pylint: disable=too-many-instance-attributes
 
     def _allow_values_access(self):
         """Valid members public attr accesses underlying parameter value."""
+        attributes = set(dir(self))
         for member in self.valid_members:
-            if member not in dir(self):
+            if member not in attributes:
                 setattr(self.__class__, member, FormValueAccess(f"_{member}"))
 
     def __str__(self):
         return f"<{type(self).__name__}> : '{self.name}' -> {self.value}"
 
     def __contains__(self, item):
-        return MEMBER_KEYS.map_key(item) in self.active
+        member = MEMBER_KEYS.map_key(item)
+        return (
+            member == "value"
+            or member in self._active_members
+            or member in self._extra_members
+        )
 
 
 class StringFormParameter(FormParameter):
     """String parameter type."""
 
+    __slots__ = ()
+
     def __init__(self, name, value=None, **kwargs):
         value = StringParameter("value", value=value)
         super().__init__(name, value=value, **kwargs)
@@ -301,6 +344,8 @@ class StringFormParameter(FormParameter):
 class BoolFormParameter(FormParameter):
     """Boolean parameter type."""
 
+    __slots__ = ()
+
     def __init__(self, name, value: bool = False, **kwargs):
         param = BoolParameter("value", value=value)
         super().__init__(name, value=param, **kwargs)
@@ -314,6 +359,8 @@ class IntegerFormParameter(FormParameter):
     :param max: Maximum value for ui element.
     """
 
+    __slots__ = ("_min", "_max")
+
     identifier_members: list[str] = []
 
     def __init__(self, name, value=None, **kwargs):
@@ -333,6 +380,8 @@ class FloatFormParameter(FormParameter):
     :param line_edit: If False, the ui element incluces a spinbox.
     """
 
+    __slots__ = ("_min", "_max", "_precision", "_line_edit")
+
     identifier_members: list[str] = ["precision", "line_edit"]
 
     def __init__(self, name, value=None, **kwargs):
@@ -351,6 +400,8 @@ class ChoiceStringFormParameter(FormParameter):
     :param choice_list: List of choices for ui dropdown.
     """
 
+    __slots__ = ("_choice_list",)
+
     identifier_members: list[str] = ["choice_list"]
     static_validations = {"required_form_members": ["choice_list"]}
 
@@ -369,6 +420,8 @@ class FileFormParameter(FormParameter):
     :param file_multi: Allow multiple files to be selected from dropdown.
     """
 
+    __slots__ = ("_file_description", "_file_type", "_file_multi")
+
     identifier_members: list[str] = ["file_description", "file_type", "file_multi"]
     static_validations = {"required_form_members": ["file_description", "file_type"]}
 
@@ -388,6 +441,8 @@ class ObjectFormParameter(FormParameter):
         dropdown.  Empty list will reveal all objects in geoh5.
     """
 
+    __slots__ = ("_mesh_type",)
+
     identifier_members: list[str] = ["mesh_type"]
     static_validations = dict(
         FormParameter.static_validations, **{"required_form_members": ["mesh_type"]}
@@ -416,6 +471,9 @@ DATA_TYPES = {
     "DateTime": DatetimeData,
     "Boolean": BooleanData,
 }
+DATA_TYPE_NAMES = tuple(DATA_TYPES)
+ASSOCIATIONS = ("Vertex", "Cell", "Face")
+DATA_GROUP_TYPES = ("3D vector", "Dip direction & dip", "Strike & dip")
 
 
 class DataFormParameter(FormParameter):
@@ -428,6 +486,8 @@ class DataFormParameter(FormParameter):
     :param data_group_type: Filters data group type.
     """
 
+    __slots__ = ("_parent", "_association", "_data_type", "_data_group_type")
+
     identifier_members: list[str] = ["data_group_type"]
     static_validations = {
         "required_form_members": ["parent", "association", "data_type"]
@@ -435,12 +495,10 @@ class DataFormParameter(FormParameter):
 
     def __init__(self, name, data_type, value=None, **kwargs):
         self._parent = StringParameter("parent")
-        self._association = ValueRestrictedParameter(
-            "association", ["Vertex", "Cell", "Face"]
-        )
-        self._data_type = ValueRestrictedParameter("data_type", list(DATA_TYPES))
+        self._association = ValueRestrictedParameter("association", ASSOCIATIONS)
+        self._data_type = ValueRestrictedParameter("data_type", DATA_TYPE_NAMES)
         self._data_group_type = ValueRestrictedParameter(
-            "data_group_type", ["3D vector", "Dip direction & dip", "Strike & dip"]
+            "data_group_type", DATA_GROUP_TYPES
         )
         value = TypeRestrictedParameter(
             "value", [DATA_TYPES.get(data_type, None)], value=value
@@ -475,6 +533,8 @@ class DataValueFormParameter(FormParameter):
     :param property: Name of property.
     """
 
+    __slots__ = ("_parent", "_association", "_data_type", "_is_value", "_property")
+
     identifier_members: list[str] = ["is_value", "property"]
     static_validations = {
         "required_form_members": [
@@ -488,10 +548,8 @@ class DataValueFormParameter(FormParameter):
 
     def __init__(self, name, data_type, value=None, **kwargs):
         self._parent = StringParameter("parent")
-        self._association = ValueRestrictedParameter(
-            "association", ["Vertex", "Cell", "Face"]
-        )
-        self._data_type = ValueRestrictedParameter("data_type", list(DATA_TYPES))
+        self._association = ValueRestrictedParameter("association", ASSOCIATIONS)
+        self._data_type = ValueRestrictedParameter("data_type", DATA_TYPE_NAMES)
         self._is_value = BoolParameter("is_value")
         self._property = TypeRestrictedParameter(
             "property", [DATA_TYPES.get(data_type, type(None))]
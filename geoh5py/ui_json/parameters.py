@@ -37,6 +37,8 @@ class Parameter:
     :param enforcers: A collection of enforcers.
     """
 
+    __slots__ = ("name", "_enforcers", "_value")
+
     static_validations: dict[str, Any] = {}
 
     def __init__(self, name: str, value: Any = None):
@@ -60,7 +62,8 @@ class Parameter:
     @value.setter
     def value(self, val):
         self._value = val
-        self.validate()
+        if self._enforcers.enforcers:
+            self.validate()
 
     def validate(self):
         """Validates data against the pool of enforcers."""
@@ -73,6 +76,8 @@ class Parameter:
 class DynamicallyRestrictedParameter(Parameter):
     """Parameter whose validations are set at runtime."""
 
+    __slots__ = ("_enforcer_type", "_restrictions")
+
     def __init__(
         self, name: str, restrictions: Any, enforcer_type="type", value: Any = None
     ):
@@ -82,7 +87,7 @@ class DynamicallyRestrictedParameter(Parameter):
 
     @property
     def restrictions(self):
-        if not isinstance(self._restrictions, list):
+        if not isinstance(self._restrictions, (list, tuple)):
             self._restrictions = {self._restrictions}
 
         return self._restrictions
@@ -95,6 +100,8 @@ class DynamicallyRestrictedParameter(Parameter):
 class ValueRestrictedParameter(DynamicallyRestrictedParameter):
     """Parameter with a restricted set of values."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, restrictions: Any, value: Any = None):
         super().__init__(name, restrictions, "value", value)
 
@@ -102,6 +109,8 @@ class ValueRestrictedParameter(DynamicallyRestrictedParameter):
 class TypeRestrictedParameter(DynamicallyRestrictedParameter):
     """Parameter with a restricted set of types known at runtime only."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, restrictions: list[Any], value: Any = None):
         super().__init__(name, restrictions, "type", value)
 
@@ -109,6 +118,8 @@ class TypeRestrictedParameter(DynamicallyRestrictedParameter):
 class TypeUIDRestrictedParameter(DynamicallyRestrictedParameter):
     """Parameter with a restricted set of type uids known at runtime only."""
 
+    __slots__ = ()
+
     def __init__(self, name: str, restrictions: list[UUID], value: Any = None):
         super().__init__(name, restrictions, "type_uid", value)
 
@@ -116,30 +127,40 @@ class TypeUIDRestrictedParameter(DynamicallyRestrictedParameter):
 class StringParameter(Parameter):
     """Parameter for string values."""
 
+    __slots__ = ()
+
     static_validations = {"type": str}
 
 
 class IntegerParameter(Parameter):
     """Parameter for integer values."""
 
+    __slots__ = ()
+
     static_validations = {"type": int}
 
 
 class FloatParameter(Parameter):
     """Parameter for float values."""
 
+    __slots__ = ()
+
     static_validations = {"type": float}
 
 
 class NumericParameter(Parameter):
     """Parameter for generic numeric values."""
 
+    __slots__ = ()
+
     static_validations = {"type": [int, float]}
 
 
 class BoolParameter(Parameter):
     """Parameter for boolean values."""
 
+    __slots__ = ()
+
     static_validations = {"type": bool}
 
     def __init__(self, name: str, value: bool = False):
@@ -149,6 +170,8 @@ class BoolParameter(Parameter):
 class StringListParameter(Parameter):
     """Parameter for list of strings."""
 
+    __slots__ = ()
+
     static_validations = {"type": [list, str]}
 
     # TODO: introduce type alias handling so that TypeEnforcer(list[str], str)
@@ -158,10 +181,14 @@ class StringListParameter(Parameter):
 class WorkspaceParameter(Parameter):
     """Parameter for workspace objects."""
 
+    __slots__ = ()
+
     static_validations = {"type": Workspace}
 
 
 class PropertyGroupParameter(Parameter):
     """Parameter for property group objects."""
 
+    __slots__ = ()
+
     static_validations = {"type": PropertyGroup}
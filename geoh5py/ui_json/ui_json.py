@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 from geoh5py.shared.utils import SetDict
@@ -25,8 +26,50 @@ from geoh5py.ui_json.forms import FormParameter
 from geoh5py.ui_json.parameters import Parameter
 
 
+def _parameter_data(param: Parameter | FormParameter, use_camel: bool = False) -> Any:
+    """Returns the form of a FormParameter or the value of a Parameter."""
+    if isinstance(param, FormParameter):
+        return param.form(use_camel)
+
+    return param.value
+
+
+class _LazyUIJsonView(Mapping):
+    """
+    Read-only snake case view of the UIJson data resolved on access.
+
+    :param parameters: Parameters of the UIJson.
+    """
+
+    def __init__(self, parameters: dict[str, Parameter | FormParameter]):
+        self._parameters = parameters
+        self._resolved: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._resolved:
+            self._resolved[key] = _parameter_data(self._parameters[key])
+
+        return self._resolved[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._parameters
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parameters)
+
+    def __len__(self) -> int:
+        return len(self._parameters)
+
+
 class UIJson:
-    """Stores parameters and data for applications executed with ui.json files."""
+    """
+    Stores parameters and data for applications executed with ui.json files.
+
+    :note: Parameter values are accessible through public namespace
+        by way of the __getattr__ and __setattr__ fallbacks.
+    """
+
+    __slots__ = ("_validations", "enforcers", "parameters")
 
     static_validations = {
         "required_uijson_parameters": [
@@ -42,7 +85,7 @@ class UIJson:
     }
 
     def __init__(self, parameters: dict[str, Parameter | FormParameter]):
-        self.__dict__["parameters"] = parameters
+        self.parameters: dict[str, Parameter | FormParameter] = parameters
         self._validations = SetDict()
         self.enforcers: EnforcerPool = EnforcerPool.from_validations(
             self.name, self.validations
@@ -53,7 +96,8 @@ class UIJson:
         """Returns a dictionary of static and inferred validations."""
 
         self._validations.update(self.dynamic_validations)
-        self._validations.update(self.static_validations)
+        # SetDict.update rewrites its argument, keep the class constant intact
+        self._validations.update(dict(self.static_validations))
 
         return self._validations
 
@@ -62,7 +106,7 @@ class UIJson:
         """Infer validations from parameters."""
         validations = SetDict()
         for param in self.parameters.values():
-            if hasattr(param, "uijson_validations"):
+            if isinstance(param, FormParameter):
                 validations.update(param.uijson_validations)
 
         return validations
@@ -77,14 +121,10 @@ class UIJson:
 
         use_camel = naming == "camel"
 
-        def get_data(param: Parameter | FormParameter):
-            return param.form(use_camel) if hasattr(param, "form") else param.value
-
-        out = {}
-        for param, value in self.parameters.items():
-            out[param] = get_data(value)
-
-        return out
+        return {
+            name: _parameter_data(param, use_camel)
+            for name, param in self.parameters.items()
+        }
 
     def update(self, data: dict[str, Any]):
         for param, value in data.items():
@@ -94,7 +134,8 @@ class UIJson:
             else:
                 self.parameters[param] = value
 
-        self.enforcers = EnforcerPool.from_validations(self.name, self.validations)
+        self.enforcers.name = self.name
+        self.enforcers.update(self.validations)
 
     def update_state(self, param: str, value: Any):
         """Updates the member values of all FormParameter objects."""
@@ -119,7 +160,7 @@ class UIJson:
 
     def validate(self):
         """Validates uijson data against a pool of enforcers."""
-        uijson = self.to_dict()
+        uijson = _LazyUIJsonView(self.parameters)
         with uijson["geoh5"].open():
             self.enforcers.enforce(uijson)
 
@@ -127,20 +168,28 @@ class UIJson:
     def name(self) -> str:
         """Returns a name for the uijson file."""
 
-        name = self.title
-        if self.geoh5 is not None:
-            return self.geoh5.h5file.stem
+        geoh5 = self.parameters.get("geoh5")
+        if geoh5 is not None and geoh5.value is not None:
+            return geoh5.value.h5file.stem
 
-        return name
+        return self.parameters["title"].value
 
     def __getattr__(self, name: str) -> Any:
-        if name in self.__dict__["parameters"]:
-            return self.__dict__["parameters"][name].value
+        parameters = object.__getattribute__(self, "parameters")
+        if name in parameters:
+            return parameters[name].value
 
-        return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     def __setattr__(self, name: str, value: Any):
-        if name in self.__dict__["parameters"]:
-            self.__dict__["parameters"][name].value = value
+        try:
+            parameters = object.__getattribute__(self, "parameters")
+        except AttributeError:
+            parameters = {}
+
+        if name in parameters:
+            parameters[name].value = value
         else:
-            self.__dict__[name] = value
+            super().__setattr__(name, value)
@@ -255,6 +255,7 @@ class Workspace(AbstractContextManager):
                 "_on_file",
                 "_centroids",
                 "_extent",
+                "_unique_parts",
                 "_visual_parameters",
             ]
             + list(omit_list),
@@ -36,8 +36,9 @@ def test_add_file(tmp_path: Path):
     group = ContainerGroup.create(workspace)
 
     xyz = np.random.randn(32)
-    np.savetxt(tmp_path / r"numpy_array.txt", xyz)
-    file_name = "numpy_array.txt"
+    np.save(tmp_path / r"numpy_array.npy", xyz)
+    file_name = "numpy_array.npy"
+    copied = []
     for obj in [curve, group]:
         file_data = obj.add_file(tmp_path / file_name)
         assert file_data.file_name == file_name, "File_name not properly set."
@@ -51,17 +52,21 @@ def test_add_file(tmp_path: Path):
 
         file_data.save_file(path=new_path)
         np.testing.assert_array_equal(
-            np.loadtxt(new_path / "numpy_array.txt"),
-            np.loadtxt(BytesIO(file_data.values)),
+            np.load(new_path / "numpy_array.npy"),
+            np.load(BytesIO(file_data.values)),
             err_msg="Loaded and stored bytes array not the same",
         )
         file_data.values = b"abc"
         obj.copy(parent=workspace_copy)
-        workspace_copy.close()
-        workspace_copy.open()
-        copied_obj = workspace_copy.get_entity(obj.uid)[0]
-        rec_data = copied_obj.get_entity("numpy_array.txt")[0]
-        compare_entities(file_data, rec_data, ignore=["_parent"])
+        copied.append((obj.uid, file_data))
+
+    # Flush the copies to disk once and read them back
+    workspace_copy.close()
+    workspace_copy.open()
+    for uid, data in copied:
+        copied_obj = workspace_copy.get_entity(uid)[0]
+        rec_data = copied_obj.get_entity(file_name)[0]
+        compare_entities(data, rec_data, ignore=["_parent"])
 
     with pytest.raises(ValueError) as excinfo:
         file_data.values = "abc"
@@ -48,6 +48,9 @@ def test_create_curve_data(tmp_path: Path):
         with pytest.warns(UserWarning, match="No cells to be removed."):
             curve.remove_cells(0)
 
+        with pytest.raises(ValueError, match="Provided parts must be of shape"):
+            curve.parts = [0, 1]
+
         # Get and change the parts
         parts = curve.parts
         parts[-3:] = 1
@@ -62,6 +65,9 @@ def test_create_curve_data(tmp_path: Path):
         with pytest.raises(TypeError, match="Indices array must be of integer type"):
             curve.cells = np.c_[0.0, 1.0]
 
+        curve.cells = [cells[:5], cells[5:]]
+        np.testing.assert_array_equal(curve.cells, cells)
+
         curve.cells = cells.tolist()
 
         data_objects = curve.add_data(
@@ -139,6 +145,10 @@ def test_remove_cells_data(tmp_path: Path):
         with pytest.raises(TypeError, match="Indices must be a list or numpy array."):
             curve.remove_vertices("abc")
 
+        curve.remove_cells([])
+
+        assert curve.n_cells == 11, "Error removing an empty list of cells."
+
         curve.remove_cells([0])
 
         assert len(data.values) == 10, "Error removing data values with cells."
@@ -190,6 +200,15 @@ def test_copy_cells_data(tmp_path):
         with pytest.raises(ValueError, match="Mask must be an array of shape."):
             curve.copy(mask=[1, 2, 3])
 
+        curve_copy = curve.copy()
+        assert curve_copy.unique_parts == curve.unique_parts == [0]
+
+        parts = curve_copy.parts
+        parts[6:] = 1
+        curve_copy.parts = parts
+        assert curve_copy.unique_parts == [0, 1]
+        assert curve.unique_parts == [0]
+
         mask = np.zeros(11, dtype=bool)
         mask[:4] = True
         copy_data = data.copy(mask=mask)
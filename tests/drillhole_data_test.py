@@ -19,7 +19,6 @@
 
 from __future__ import annotations
 
-import random
 import string
 
 import numpy as np
@@ -30,6 +29,8 @@ from geoh5py.objects import Drillhole
 from geoh5py.shared.utils import compare_entities
 from geoh5py.workspace import Workspace
 
+_RNG = np.random.default_rng(0)
+
 
 def test_create_drillhole_data(tmp_path):
     h5file_path = tmp_path / r"testCurve.geoh5"
@@ -51,33 +52,37 @@ def test_create_drillhole_data(tmp_path):
             well.desurvey(0.0)
 
         well.collar = [0.0, 10.0, 10]
-        well.surveys = np.c_[
-            np.linspace(0, max_depth, n_data),
-            np.ones(n_data) * 45.0,
-            np.linspace(-89, -75, n_data),
-        ]
+        surveys = np.empty((n_data, 3))
+        surveys[:, 0] = np.linspace(0, max_depth, n_data)
+        surveys[:, 1] = 45.0
+        surveys[:, 2] = np.linspace(-89, -75, n_data)
+        well.surveys = surveys
 
         with pytest.raises(ValueError, match="Origin must be a list or numpy array"):
             well.collar = [1.0, 10]
 
         value_map = {}
         for ref in range(8):
-            value_map[ref] = "".join(
-                random.choice(string.ascii_lowercase) for i in range(8)
-            )
+            value_map[ref] = "".join(_RNG.choice(list(string.ascii_lowercase), 8))
         value_map[0] = "Unknown"
 
+        # Draw all normal samples of the test at once
+        normal = _RNG.standard_normal(4 * 25 + 2 * n_data)
+
         # Create random from-to
-        from_to_a = np.sort(
-            np.random.uniform(low=0.05, high=max_depth, size=(50,))
-        ).reshape((-1, 2))
-        from_to_b = np.vstack([from_to_a[0, :], [30.1, 55.5], [56.5, 80.2]])
+        depths = _RNG.uniform(low=0.05, high=max_depth, size=(50,))
+        depths.sort()
+        from_to_a = depths.reshape((-1, 2))
+        from_to_b = np.empty((3, 2))
+        from_to_b[0] = from_to_a[0]
+        from_to_b[1] = (30.1, 55.5)
+        from_to_b[2] = (56.5, 80.2)
 
         with pytest.raises(ValueError) as error:
             well.add_data(
                 {
                     "interval_values": {
-                        "values": np.random.randn(from_to_a.shape[0]),
+                        "values": normal[:25],
                         "from-to": from_to_a[1:, 0],
                     },
                 }
@@ -89,7 +94,7 @@ def test_create_drillhole_data(tmp_path):
             well.add_data(
                 {
                     "interval_values": {
-                        "values": np.random.randn(from_to_a.shape[0]),
+                        "values": normal[25:50],
                         "from-to": from_to_a[:, 0],
                     },
                 }
@@ -101,7 +106,7 @@ def test_create_drillhole_data(tmp_path):
             well.add_data(
                 {
                     "interval_values": {
-                        "values": np.random.randn(from_to_a.shape[0]),
+                        "values": normal[50:75],
                         "from-to": from_to_a[:, 0],
                         "collocation_distance": -1,
                     },
@@ -114,7 +119,7 @@ def test_create_drillhole_data(tmp_path):
         data_objects = well.add_data(
             {
                 "interval_values": {
-                    "values": np.random.randn(from_to_a.shape[0]),
+                    "values": normal[75:100],
                     "from-to": from_to_a.tolist(),
                 },
                 "int_interval_list": {
@@ -126,9 +131,7 @@ def test_create_drillhole_data(tmp_path):
                 "text_list": {
                     "values": np.array(
                         [
-                            "".join(
-                                random.choice(string.ascii_lowercase) for _ in range(6)
-                            )
+                            "".join(_RNG.choice(list(string.ascii_lowercase), 6))
                             for _ in range(3)
                         ]
                     ),
@@ -160,8 +163,8 @@ def test_create_drillhole_data(tmp_path):
             well.add_data(
                 {
                     "log_values": {
-                        "values": np.random.randn(n_data - 1),
-                        "depth": np.random.randn(n_data),
+                        "values": normal[100 : 99 + n_data],
+                        "depth": normal[100 + n_data :],
                     },
                 }
             )
@@ -173,9 +176,9 @@ def test_create_drillhole_data(tmp_path):
             well.add_data(
                 {
                     "log_int": {
-                        "depth": np.sort(np.random.rand(n_data) * max_depth),
+                        "depth": np.sort(_RNG.random(n_data) * max_depth),
                         "type": "referenced",
-                        "values": np.random.randint(1, high=8, size=n_data),
+                        "values": _RNG.integers(1, high=8, size=n_data),
                         "value_map": value_map,
                     }
                 }
@@ -202,9 +205,9 @@ def test_create_drillhole_data(tmp_path):
             well.add_data(
                 {
                     "log_bool": {
-                        "depth": np.sort(np.random.rand(n_data) * max_depth),
+                        "depth": np.sort(_RNG.random(n_data) * max_depth),
                         "type": "boolean",
-                        "values": np.random.choice([True, False], size=n_data),
+                        "values": _RNG.choice([True, False], size=n_data),
                     }
                 }
             )
@@ -217,9 +220,9 @@ def test_create_drillhole_data(tmp_path):
             well.add_data(
                 {
                     "log_float": {
-                        "depth": np.sort(np.random.rand(n_data) * max_depth),
+                        "depth": np.sort(_RNG.random(n_data) * max_depth),
                         "type": "FLOAT",
-                        "values": np.random.rand(n_data).astype(float),
+                        "values": _RNG.random(n_data).astype(float),
                     }
                 }
             )
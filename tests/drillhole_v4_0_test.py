@@ -168,15 +168,15 @@ def test_create_drillhole_data(tmp_path):  # pylint: disable=too-many-statements
     with Workspace.create(h5file_path, version=2.0) as workspace:
         # Create a workspace
         dh_group = DrillholeGroup.create(workspace)
+        surveys = np.empty((n_data, 3))
+        surveys[:, 0] = np.linspace(0, 100, n_data)
+        surveys[:, 1] = 45.0
+        surveys[:, 2] = np.linspace(-89, -75, n_data)
 
         well = Drillhole.create(
             workspace,
             collar=np.r_[0.0, 10.0, 10],
-            surveys=np.c_[
-                np.linspace(0, 100, n_data),
-                np.ones(n_data) * 45.0,
-                np.linspace(-89, -75, n_data),
-            ],
+            surveys=surveys,
             parent=dh_group,
             name=well_name,
         )
@@ -291,10 +291,13 @@ def test_create_drillhole_data(tmp_path):  # pylint: disable=too-many-statements
         well_b.collar = np.r_[10.0, 10.0, 10]
 
         # Create random from-to
-        from_to_a = np.sort(np.random.uniform(low=0.05, high=100, size=(50,))).reshape(
-            (-1, 2)
-        )
-        from_to_b = np.vstack([from_to_a[0, :], [30.1, 55.5], [56.5, 80.2]])
+        depths = np.random.uniform(low=0.05, high=100, size=(50,))
+        depths.sort()
+        from_to_a = depths.reshape((-1, 2))
+        from_to_b = np.empty((3, 2))
+        from_to_b[0] = from_to_a[0]
+        from_to_b[1] = (30.1, 55.5)
+        from_to_b[2] = (56.5, 80.2)
 
         # Add from-to data
         data_objects = well.add_data(
@@ -503,21 +506,21 @@ def create_drillholes(h5file_path, version=1.0, ga_version="1.0"):
     ) as workspace:
         # Create a workspace
         dh_group = DrillholeGroup.create(workspace, name="DH_group")
+        surveys = np.empty((n_data, 3))
+        surveys[:, 0] = np.linspace(0, 100, n_data)
+        surveys[:, 1] = 45.0
+        surveys[:, 2] = np.linspace(-89, -75, n_data)
         well = Drillhole.create(
             workspace,
             collar=np.r_[0.0, 10.0, 10],
-            surveys=np.c_[
-                np.linspace(0, 100, n_data),
-                np.ones(n_data) * 45.0,
-                np.linspace(-89, -75, n_data),
-            ],
+            surveys=surveys,
             parent=dh_group,
             name=well_name,
         )
         # Create random from-to
-        from_to_a = np.sort(np.random.uniform(low=0.05, high=100, size=(50,))).reshape(
-            (-1, 2)
-        )
+        depths = np.random.uniform(low=0.05, high=100, size=(50,))
+        depths.sort()
+        from_to_a = depths.reshape((-1, 2))
 
         values = np.random.randn(50)
         values[0] = np.nan
@@ -23,6 +23,7 @@ import numpy as np
 import pytest
 
 from geoh5py.objects import Curve
+from geoh5py.shared.utils import instance_attributes
 from geoh5py.workspace import Workspace
 
 
@@ -30,17 +31,16 @@ def test_modify_property_group(tmp_path):
     def compare_objects(object_a, object_b, ignore=None):
         if ignore is None:
             ignore = ["_workspace", "_children", "_parent"]
-        for attr in object_a.__dict__.keys():
+        for attr in instance_attributes(object_a):
             if attr in ignore:
                 continue
-            if isinstance(getattr(object_a, attr[1:]), ABC):
-                compare_objects(
-                    getattr(object_a, attr[1:]), getattr(object_b, attr[1:])
-                )
+            key = attr[1:] if attr[0] == "_" else attr
+            if isinstance(getattr(object_a, key), ABC):
+                compare_objects(getattr(object_a, key), getattr(object_b, key))
             else:
                 assert np.all(
-                    getattr(object_a, attr[1:]) == getattr(object_b, attr[1:])
-                ), f"Output attribute {attr[1:]} for {object_a} do not match input {object_b}"
+                    getattr(object_a, key) == getattr(object_b, key)
+                ), f"Output attribute {key} for {object_a} do not match input {object_b}"
 
     obj_name = "myCurve"
     # Generate a curve with multiple data
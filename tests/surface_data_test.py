@@ -57,6 +57,14 @@ def test_create_surface_data(tmp_path: Path):
         with pytest.raises(TypeError, match="Indices array must be of integer type"):
             surface.cells = simplices.astype(float)
 
+        surface.cells = [simplices[:50], simplices[50:]]
+        np.testing.assert_array_equal(surface.cells, simplices)
+
+        cells = simplices.astype(np.int32)
+        surface.cells = cells
+        cells[0, :] = 0
+        np.testing.assert_array_equal(surface.cells, simplices)
+
         surface.cells = simplices.tolist()
 
         data = surface.add_data({"TMI": {"values": values}})
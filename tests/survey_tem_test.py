@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import numpy as np
@@ -302,6 +303,35 @@ def test_survey_airborne_tem_data(tmp_path):
     assert "Discretization" not in receivers.metadata["EM Dataset"]["Waveform"]
     receivers.timing_mark = 10**-3.1
     receivers.waveform = waveform
+    np.testing.assert_almost_equal(transmitters.waveform, waveform)
+
+    receivers.waveform[0, 1] = -1.0
+    np.testing.assert_almost_equal(receivers.waveform, waveform)
+
+    receivers.waveform = waveform[::2]
+    np.testing.assert_almost_equal(transmitters.waveform, waveform[::2])
+
+    metadata_waveform = receivers.metadata["EM Dataset"]["Waveform"]
+    metadata_waveform["Discretization"][0]["current"] = 0.5
+    receivers.edit_em_metadata({"Waveform": metadata_waveform})
+    assert receivers.waveform[0, 1] == transmitters.waveform[0, 1] == 0.5
+
+    with receivers.edit_em_metadata_batch():
+        receivers.timing_mark = 10**-3.0
+        receivers.waveform = waveform
+
+    assert receivers.timing_mark == transmitters.timing_mark == 10**-3.0
+    np.testing.assert_almost_equal(transmitters.waveform, waveform)
+
+    with pytest.raises(ValueError, match="abort"):
+        with receivers.edit_em_metadata_batch():
+            receivers.timing_mark = 10**-2.0
+            raise ValueError("abort")
+
+    assert receivers.timing_mark == transmitters.timing_mark == 10**-3.0
+    on_file = workspace.fetch_metadata(receivers.uid)["EM Dataset"]
+    assert on_file["Waveform"]["Timing mark"] == 10**-3.0
+    receivers.timing_mark = 10**-3.1
 
     with pytest.raises(ValueError, match="Mask must be an array of shape"):
         receivers.copy(mask=np.r_[1, 2, 3])
@@ -552,3 +582,30 @@ def test_create_survey_ground_tem(tmp_path):
         transmitters_rec,
         ignore=["_receivers", "_transmitters", "_parent", "_property_groups"],
     )
+
+
+def test_survey_tem_waveform_parameters(tmp_path):
+    with Workspace.create(Path(tmp_path) / r"test_waveform_parameters.geoh5") as ws:
+        receivers = AirborneTEMReceivers.create(ws, vertices=np.random.rand(5, 3))
+
+        assert receivers.waveform_parameters is None
+
+        data = receivers.add_data(
+            {
+                "_waveform_parameters": {
+                    "values": json.dumps({"ramp": 1.0}),
+                    "type": "TEXT",
+                    "association": "OBJECT",
+                }
+            }
+        )
+
+        assert receivers.waveform_parameters == {"ramp": 1.0}
+
+        receivers.waveform_parameters["ramp"] = 3.0
+
+        assert receivers.waveform_parameters == {"ramp": 1.0}
+
+        data.values = json.dumps({"ramp": 2.0})
+
+        assert receivers.waveform_parameters == {"ramp": 2.0}
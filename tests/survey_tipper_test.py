@@ -35,6 +35,8 @@ def test_create_survey_tipper(tmp_path):
     vertices = np.c_[xlocs, np.random.randn(xlocs.shape[0], 2)]
     receivers = TipperReceivers.create(workspace, vertices=vertices)
     receivers.channels = [30.0, 45.0, 90.0, 180.0, 360.0, 720.0]
+    receivers.unit = "KiloHertz (kHz)"
+    assert receivers.unit == "KiloHertz (kHz)"
     assert isinstance(
         receivers, TipperReceivers
     ), "Entity type TipperReceivers failed to create."
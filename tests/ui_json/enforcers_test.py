@@ -89,6 +89,23 @@ def test_enforcer_pool_from_validations():
     assert pool.enforcers == [TypeEnforcer(str)]
 
 
+def test_enforcer_pool_update():
+    pool = EnforcerPool.from_validations(
+        "my_param", SetDict(type=str, value="onlythis")
+    )
+    type_enforcer, value_enforcer = pool.enforcers
+    pool.update(SetDict(type=str, value=["onlythis", "orthis"], required="me"))
+
+    assert pool.enforcers[0] is type_enforcer
+    assert pool.enforcers[1] is not value_enforcer
+    assert pool.validations == SetDict(
+        type=str, value=["onlythis", "orthis"], required="me"
+    )
+
+    pool.update(SetDict(type=str))
+    assert pool.enforcers == [TypeEnforcer({str})]
+
+
 def test_enforcer_pool_raises_single_error():
     enforcers = EnforcerPool("my_param", [TypeEnforcer({str})])
     enforcers.enforce("1")
@@ -76,6 +76,7 @@ def test_form_parameter_valid_members():
     ]
     assert len(param.valid_members) == len(valid_members)
     assert all(k in valid_members for k in param.valid_members)
+    assert not hasattr(param, "__dict__")
 
 
 def test_form_parameter_active():
@@ -85,6 +86,10 @@ def test_form_parameter_active():
     assert param.active == ["value", "enabled"]
     param.enabled = False
     assert param.active == ["value", "enabled"]
+    param.label = "my param"
+    param.enabled = True
+    assert param.active == ["value", "enabled", "label"]
+    assert list(param.form()) == ["value", "enabled", "label"]
 
 
 def test_form_parameter_contains():
@@ -97,6 +102,9 @@ def test_form_parameter_contains():
     assert "group" not in param
     param.group = "my group"
     assert "group" in param
+    assert "groupOptional" not in param
+    param.group_optional = True
+    assert "groupOptional" in param
 
 
 def test_form_parameter_defaults():
@@ -152,6 +160,10 @@ def test_form_parameter_required_validations():
     with pytest.raises(RequiredFormMemberValidationError, match=msg):
         param.validate()
 
+    assert FormParameter.static_validations == {
+        "required_form_members": ["label", "value"]
+    }
+
 
 def test_form_parameter_roundtrip():
     form = {"label": "my param", "enabled": False, "extra": "stuff"}
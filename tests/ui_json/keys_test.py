@@ -38,3 +38,5 @@ def test_keys():
     assert list(keys.map(mappable_keys)) == list(mappable_keys.values())
     inv_mappable_keys = {v: k for k, v in mappable_keys.items()}
     assert list(keys.map(inv_mappable_keys, convention="camel")) == list(mappable_keys)
+    assert keys.snake_to_camel is keys.snake_to_camel
+    assert keys.snake_to_camel == inv_mappable_keys
@@ -19,6 +19,7 @@
 import pytest
 
 from geoh5py.shared.exceptions import TypeValidationError, ValueValidationError
+from geoh5py.shared.utils import SetDict
 from geoh5py.ui_json.parameters import (
     BoolParameter,
     FloatParameter,
@@ -46,9 +47,35 @@ def test_parameter_validations_on_setting():
         param.value = 1
 
 
+def test_parameter_validations_independent():
+    param_a = StringParameter("param_a")
+    param_b = StringParameter("param_b")
+    param_a.value = "text"
+    with pytest.raises(TypeValidationError, match="provided for 'param_b'"):
+        param_b.value = 1
+
+    param_c = ValueRestrictedParameter("param_c", [1, 2])
+    param_d = ValueRestrictedParameter("param_d", [2, 3])
+    param_c.value = 1
+    with pytest.raises(ValueValidationError, match="Must be one of: '2', '3'"):
+        param_d.value = 1
+
+
+def test_parameter_overridden_validations():
+    class EvenParameter(Parameter):
+        @property
+        def validations(self):
+            return SetDict(value=[0, 2, 4])
+
+    param = EvenParameter("my_param", 2)
+    with pytest.raises(ValueValidationError):
+        param.value = 3
+
+
 def test_parameter_str_representation():
     param = Parameter("my_param")
     assert str(param) == "<Parameter> : 'my_param' -> None"
+    assert not hasattr(param, "__dict__")
 
 
 def test_string_parameter_type_validation():
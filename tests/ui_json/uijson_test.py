@@ -25,6 +25,7 @@ import pytest
 from geoh5py import Workspace
 from geoh5py.objects import Points
 from geoh5py.shared.exceptions import (
+    AggregateValidationError,
     RequiredObjectDataValidationError,
     RequiredUIJsonParameterValidationError,
 )
@@ -229,6 +230,13 @@ def test_getattr():
     assert uijson.title == "my application"
     assert uijson.parameters["title"].value == "my application"
     assert uijson.enforcers
+    uijson.save_name = "new name"  # pylint: disable=attribute-defined-outside-init
+    assert uijson.parameters["save_name"].value == "new name"
+    assert "save_name" not in dir(UIJson)
+
+    other = UIJson({"title": StringParameter("title", value="other")})
+    with pytest.raises(AttributeError, match="has no attribute 'save_name'"):
+        getattr(other, "save_name")
 
 
 def test_uijson_update_raises_error():
@@ -321,6 +329,52 @@ def test_uijson_raises_required_object_data_validation_error(tmp_path):
         uijson.validate()
 
 
+def test_uijson_validate_after_fixing_errors(tmp_path):
+    uijson = generate_sample_defaulted_uijson()
+    filename = write_uijson(tmp_path, uijson)
+    workspace, data_object = generate_sample_uijson_data(tmp_path)
+
+    with workspace.open():
+        pts = Points.create(
+            workspace, vertices=np.random.rand(10, 3), name="other object"
+        )
+        wrong_data = pts.add_data({"wrong data": {"values": np.random.rand(10)}})
+
+    ifile = InputFile.read_ui_json(
+        populate_sample_uijson(
+            filename,
+            workspace,
+            data_object,
+            {"x_channel": str(wrong_data.uid), "data_path": "my_data_path"},
+        ),
+        validate=False,
+    )
+    with ifile.geoh5.open() as workspace:
+        for param, value in ifile.ui_json.items():
+            if isinstance(value, uuid.UUID):
+                ifile.data[param] = workspace.get_entity(value)
+
+    uijson.update(ifile.ui_json)
+    title = uijson.parameters.pop("title")
+    with pytest.raises(AggregateValidationError, match="collected 2 errors"):
+        uijson.validate()
+
+    uijson.parameters["title"] = title
+    ifile = InputFile.read_ui_json(
+        populate_sample_uijson(
+            filename,
+            workspace,
+            data_object,
+            {
+                "x_channel": str(data_object.get_data("Bx")[0].uid),
+                "data_path": "my_data_path",
+            },
+        )
+    )
+    uijson.update(ifile.ui_json)
+    uijson.validate()
+
+
 def test_validations():
     uijson = generate_sample_defaulted_uijson()
     assert (